@@ -4,7 +4,6 @@ from typing import List
 
 from sqlalchemy.orm import Session
 
-from dispatch.case import service as case_service
 from dispatch.case.models import CaseRead
 from dispatch.conversation import flows as conversation_flows
 from dispatch.database.core import SessionLocal
@@ -34,10 +33,13 @@ from dispatch.storage.enums import StorageAction
 from dispatch.ticket import flows as ticket_flows
 
 from .models import Case, CaseStatus
-from .service import get
+from .service import get_with_flow_relations, has_incidents
 
 log = logging.getLogger(__name__)
 
+# case statuses for which the case document is kept up to date
+_DOCUMENT_UPDATE_STATUSES = frozenset({CaseStatus.escalated, CaseStatus.closed})
+
 
 def get_case_participants_flow(case: Case, db_session: SessionLocal):
     """Get additional case participants based on priority, type and description."""
@@ -77,21 +79,22 @@ def case_add_or_reactivate_participant_flow(
     db_session=None,
 ):
     """Runs the case add or reactive participant flow."""
-    case = case_service.get(db_session=db_session, case_id=case_id)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
+
+    # we look up the participant by email and service in a single query
+    participants = participant_service.get_by_case_id_email_or_service_id(
+        db_session=db_session, case_id=case.id, email=user_email, service_id=service_id
+    )
 
     if service_id:
         # we need to ensure that we don't add another member of a service if one
         # already exists (e.g. overlapping oncalls, we assume they will hand-off if necessary)
-        participant = participant_service.get_by_case_id_and_service_id(
-            case_id=case_id, service_id=service_id, db_session=db_session
-        )
-
-        if participant:
+        if any(p.service_id == service_id for p in participants):
             log.debug("Skipping resolved participant. Oncall service member already engaged.")
             return
 
-    participant = participant_service.get_by_case_id_and_email(
-        db_session=db_session, case_id=case.id, email=user_email
+    participant = next(
+        (p for p in participants if p.individual and p.individual.email == user_email), None
     )
     if participant:
         if participant.active_roles:
@@ -134,7 +137,7 @@ def case_remove_participant_flow(
     db_session: Session,
 ):
     """Runs the remove participant flow."""
-    case = case_service.get(db_session=db_session, case_id=case_id)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
     if not case:
         log.warn(
@@ -169,6 +172,10 @@ def update_conversation(case: Case, db_session: Session) -> None:
     plugin = plugin_service.get_active_instance(
         db_session=db_session, project_id=case.project.id, plugin_type="conversation"
     )
+    if not plugin:
+        log.warning("Case conversation not updated. No conversation plugin enabled.")
+        return
+
     plugin.instance.update_thread(
         case=case, conversation_id=case.conversation.channel_id, ts=case.conversation.thread_id
     )
@@ -192,7 +199,7 @@ def case_new_create_flow(
 ):
     """Runs the case new creation flow."""
     # we get the case
-    case = get(db_session=db_session, case_id=case_id)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
     # we create the ticket
     ticket_flows.create_case_ticket(case=case, db_session=db_session)
@@ -213,6 +220,7 @@ def case_new_create_flow(
         create_all_resources=create_all_resources,
     )
 
+    # we commit before paging so we don't hold the transaction open during the external call
     db_session.add(case)
     db_session.commit()
 
@@ -230,12 +238,21 @@ def case_new_create_flow(
             db_session=db_session, project_id=case.project.id, plugin_type="oncall"
         )
         if oncall_plugin:
-            oncall_plugin.instance.page(
-                service_id=service_id,
-                incident_name=case.name,
-                incident_title=case.title,
-                incident_description=case.description,
-            )
+            try:
+                oncall_plugin.instance.page(
+                    service_id=service_id,
+                    incident_name=case.name,
+                    incident_title=case.title,
+                    incident_description=case.description,
+                )
+            except Exception as e:
+                event_service.log_case_event(
+                    db_session=db_session,
+                    source=oncall_plugin.plugin.title,
+                    description=f"Paging of case assignee failed. Reason: {e}",
+                    case_id=case.id,
+                )
+                log.exception(e)
         else:
             log.warning("Case assignee not paged. No plugin of type oncall enabled.")
             return case
@@ -247,16 +264,15 @@ def case_new_create_flow(
 def case_triage_create_flow(*, case_id: int, organization_slug: OrganizationSlug, db_session=None):
     """Runs the case triage creation flow."""
     # we run the case new creation flow
-    case_new_create_flow(
+    case = case_new_create_flow(
         case_id=case_id, organization_slug=organization_slug, db_session=db_session
     )
 
-    # we get the case
-    case = get(db_session=db_session, case_id=case_id)
-
     # we transition the case to the triage state
     case_triage_status_flow(case=case, db_session=db_session)
 
+    db_session.commit()
+
 
 @background_task
 def case_escalated_create_flow(
@@ -264,38 +280,40 @@ def case_escalated_create_flow(
 ):
     """Runs the case escalated creation flow."""
     # we run the case new creation flow
-    case_new_create_flow(
+    case = case_new_create_flow(
         case_id=case_id, organization_slug=organization_slug, db_session=db_session
     )
 
-    # we get the case
-    case = get(db_session=db_session, case_id=case_id)
+    now = datetime.utcnow()
 
     # we transition the case to the triage state
-    case_triage_status_flow(case=case, db_session=db_session)
+    case_triage_status_flow(case=case, db_session=db_session, now=now)
 
     # we transition the case to the escalated state
     case_escalated_status_flow(
-        case=case, organization_slug=organization_slug, db_session=db_session
+        case=case, organization_slug=organization_slug, db_session=db_session, now=now
     )
 
+    db_session.commit()
+
 
 @background_task
 def case_closed_create_flow(*, case_id: int, organization_slug: OrganizationSlug, db_session=None):
     """Runs the case closed creation flow."""
     # we run the case new creation flow
-    case_new_create_flow(
+    case = case_new_create_flow(
         case_id=case_id, organization_slug=organization_slug, db_session=db_session
     )
 
-    # we get the case
-    case = get(db_session=db_session, case_id=case_id)
+    now = datetime.utcnow()
 
     # we transition the case to the triage state
-    case_triage_status_flow(case=case, db_session=db_session)
+    case_triage_status_flow(case=case, db_session=db_session, now=now)
 
     # we transition the case to the closed state
-    case_closed_status_flow(case=case, db_session=db_session)
+    case_closed_status_flow(case=case, db_session=db_session, now=now)
+
+    db_session.commit()
 
 
 def case_details_changed(case: Case, previous_case: CaseRead) -> bool:
@@ -320,7 +338,7 @@ def case_update_flow(
 ):
     """Runs the case update flow."""
     # we get the case
-    case = get(db_session=db_session, case_id=case_id)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
     if reporter_email:
         # we run the case assign role flow for the reporter
@@ -352,30 +370,22 @@ def case_update_flow(
     # we update the ticket
     ticket_flows.update_case_ticket(case=case, db_session=db_session)
 
-    if case.status in [CaseStatus.escalated, CaseStatus.closed] and case.case_document:
+    if case.status in _DOCUMENT_UPDATE_STATUSES and case.case_document:
         # we update the document
         document_flows.update_document(
             document=case.case_document, project_id=case.project.id, db_session=db_session
         )
 
-    if case.tactical_group:
+    group_members = [email for email in (reporter_email, assignee_email) if email]
+    if case.tactical_group and group_members:
         # we update the tactical group
-        if reporter_email:
-            group_flows.update_group(
-                subject=case,
-                group=case.tactical_group,
-                group_action=GroupAction.add_member,
-                group_member=reporter_email,
-                db_session=db_session,
-            )
-        if assignee_email:
-            group_flows.update_group(
-                subject=case,
-                group=case.tactical_group,
-                group_action=GroupAction.add_member,
-                group_member=assignee_email,
-                db_session=db_session,
-            )
+        group_flows.update_group(
+            subject=case,
+            group=case.tactical_group,
+            group_action=GroupAction.add_members,
+            group_members=group_members,
+            db_session=db_session,
+        )
 
     if case.conversation and case.has_thread:
         # we send the case updated notification
@@ -412,27 +422,24 @@ def case_new_status_flow(case: Case, db_session=None):
     pass
 
 
-def case_triage_status_flow(case: Case, db_session=None):
+def case_triage_status_flow(case: Case, db_session=None, now: datetime | None = None):
     """Runs the case triage transition flow."""
     # we set the triage_at time during transitions if not already set
     if not case.triage_at:
-        case.triage_at = datetime.utcnow()
-        db_session.add(case)
-        db_session.commit()
+        case.triage_at = now or datetime.utcnow()
 
 
 def case_escalated_status_flow(
     case: Case,
     organization_slug: OrganizationSlug,
     db_session: Session,
-    incident_priority: IncidentType | None,
-    incident_type: IncidentPriority | None,
+    incident_priority: IncidentPriority | None = None,
+    incident_type: IncidentType | None = None,
+    now: datetime | None = None,
 ):
     """Runs the case escalated transition flow."""
     # we set the escalated_at time
-    case.escalated_at = datetime.utcnow()
-    db_session.add(case)
-    db_session.commit()
+    case.escalated_at = now or datetime.utcnow()
 
     case_to_incident_escalate_flow(
         case=case,
@@ -443,12 +450,10 @@ def case_escalated_status_flow(
     )
 
 
-def case_closed_status_flow(case: Case, db_session=None):
+def case_closed_status_flow(case: Case, db_session=None, now: datetime | None = None):
     """Runs the case closed transition flow."""
     # we set the closed_at time
-    case.closed_at = datetime.utcnow()
-    db_session.add(case)
-    db_session.commit()
+    case.closed_at = now or datetime.utcnow()
 
     # Archive the conversation if there is a dedicated channel
     if case.dedicated_channel:
@@ -512,106 +517,53 @@ def case_active_status_flow(case: Case, db_session: Session) -> None:
         reactivate_case_participants(case, db_session)
 
 
-def case_status_transition_flow_dispatcher(
-    case: Case,
-    current_status: CaseStatus,
-    previous_status: CaseStatus,
-    organization_slug: OrganizationSlug,
-    db_session: Session,
-):
-    """Runs the correct flows based on the current and previous status of the case."""
-    match (previous_status, current_status):
-        case (CaseStatus.closed, CaseStatus.new):
-            # Closed -> New
-            case_active_status_flow(case, db_session)
-
-        case (_, CaseStatus.new):
-            # Any -> New
-            pass
-
-        case (CaseStatus.new, CaseStatus.triage):
-            # New -> Triage
-            case_triage_status_flow(
-                case=case,
-                db_session=db_session,
-            )
+def _triage_transition(case, organization_slug, db_session, now):
+    case_triage_status_flow(case=case, db_session=db_session, now=now)
 
-        case (CaseStatus.closed, CaseStatus.triage):
-            # Closed -> Triage
-            case_active_status_flow(case, db_session)
-            case_triage_status_flow(
-                case=case,
-                db_session=db_session,
-            )
 
-        case (_, CaseStatus.triage):
-            # Any -> Triage/
-            pass
+def _escalated_transition(case, organization_slug, db_session, now):
+    case_escalated_status_flow(
+        case=case, organization_slug=organization_slug, db_session=db_session, now=now
+    )
 
-        case (CaseStatus.new, CaseStatus.escalated):
-            # New -> Escalated
-            case_triage_status_flow(
-                case=case,
-                db_session=db_session,
-            )
-            case_escalated_status_flow(
-                case=case,
-                organization_slug=organization_slug,
-                db_session=db_session,
-            )
 
-        case (CaseStatus.triage, CaseStatus.escalated):
-            # Triage -> Escalated
-            case_escalated_status_flow(
-                case=case,
-                organization_slug=organization_slug,
-                db_session=db_session,
-            )
+def _closed_transition(case, organization_slug, db_session, now):
+    case_closed_status_flow(case=case, db_session=db_session, now=now)
 
-        case (CaseStatus.closed, CaseStatus.escalated):
-            # Closed -> Escalated
-            case_active_status_flow(case, db_session)
-            case_triage_status_flow(
-                case=case,
-                db_session=db_session,
-            )
-            case_escalated_status_flow(
-                case=case,
-                organization_slug=organization_slug,
-                db_session=db_session,
-            )
 
-        case (_, CaseStatus.escalated):
-            # Any -> Escalated
-            pass
+# maps (previous status, current status) transitions to the flows they run, in order.
+# transitions not listed here don't require any flows to be run.
+_STATUS_TRANSITION_FLOWS = {
+    (CaseStatus.new, CaseStatus.triage): (_triage_transition,),
+    (CaseStatus.closed, CaseStatus.triage): (_triage_transition,),
+    (CaseStatus.new, CaseStatus.escalated): (_triage_transition, _escalated_transition),
+    (CaseStatus.triage, CaseStatus.escalated): (_escalated_transition,),
+    (CaseStatus.closed, CaseStatus.escalated): (_triage_transition, _escalated_transition),
+    (CaseStatus.new, CaseStatus.closed): (_triage_transition, _closed_transition),
+    (CaseStatus.triage, CaseStatus.closed): (_closed_transition,),
+    (CaseStatus.escalated, CaseStatus.closed): (_closed_transition,),
+}
 
-        case (CaseStatus.new, CaseStatus.closed):
-            # New -> Closed
-            case_triage_status_flow(
-                case=case,
-                db_session=db_session,
-            )
-            case_closed_status_flow(
-                case=case,
-                db_session=db_session,
-            )
 
-        case (CaseStatus.triage, CaseStatus.closed):
-            # Triage -> Closed
-            case_closed_status_flow(
-                case=case,
-                db_session=db_session,
-            )
+def case_status_transition_flow_dispatcher(
+    case: Case,
+    current_status: CaseStatus,
+    previous_status: CaseStatus,
+    organization_slug: OrganizationSlug,
+    db_session: Session,
+):
+    """Runs the correct flows based on the current and previous status of the case."""
+    if previous_status == CaseStatus.closed and current_status != CaseStatus.closed:
+        # we reactivate the case before running any other transition flows
+        case_active_status_flow(case, db_session)
 
-        case (CaseStatus.escalated, CaseStatus.closed):
-            # Escalated -> Closed
-            case_closed_status_flow(
-                case=case,
-                db_session=db_session,
-            )
+    # we use the same time for all the transitions that happen at once
+    now = datetime.utcnow()
+    for flow in _STATUS_TRANSITION_FLOWS.get((previous_status, current_status), ()):
+        flow(case, organization_slug, db_session, now)
 
-        case (_, _):
-            pass
+    # we commit all the changes made by the transition flows at once
+    db_session.commit()
 
 
 def send_escalation_messages_for_channel_case(
@@ -707,29 +659,35 @@ def common_escalate_flow(
     db_session.add(case)
     db_session.commit()
 
-    event_service.log_case_event(
-        db_session=db_session,
-        source="Dispatch Core App",
-        description=f"The case has been linked to incident {incident.name} in the {incident.project.name} project",
-        case_id=case.id,
-    )
+    # we read these once, as the commits below expire the incident and its relationships
+    incident_name, incident_project_name = incident.name, incident.project.name
+    tactical_group = incident.tactical_group
+    tactical_group_email = tactical_group.email if tactical_group else None
 
-    if case.storage and incident.tactical_group:
-        storage_members = [incident.tactical_group.email]
+    event_descriptions = [
+        f"The case has been linked to incident {incident_name} in the {incident_project_name} project"
+    ]
+
+    if case.storage and tactical_group_email:
         storage_flows.update_storage(
             subject=case,
             storage_action=StorageAction.add_members,
-            storage_members=storage_members,
+            storage_members=[tactical_group_email],
             db_session=db_session,
         )
 
-        event_service.log_case_event(
-            db_session=db_session,
-            source="Dispatch Core App",
-            description=f"The members of the incident's tactical group {incident.tactical_group.email} have been given permission to access the case's storage folder",
-            case_id=case.id,
+        event_descriptions.append(
+            f"The members of the incident's tactical group {tactical_group_email} have been given permission to access the case's storage folder"
         )
 
+    # we log a single event for the escalation
+    event_service.log_case_event(
+        db_session=db_session,
+        source="Dispatch Core App",
+        description="\n".join(event_descriptions),
+        case_id=case.id,
+    )
+
 
 def case_to_incident_escalate_flow(
     case: Case,
@@ -738,7 +696,8 @@ def case_to_incident_escalate_flow(
     incident_priority: IncidentPriority | None,
     incident_type: IncidentType,
 ):
-    if case.incidents:
+    # we check for linked incidents without loading them
+    if has_incidents(db_session=db_session, case_id=case.id):
         return
 
     reporter = ParticipantUpdate(
@@ -779,10 +738,11 @@ def case_to_incident_endpoint_escalate_flow(
     organization_slug: OrganizationSlug,
     db_session: Session = None,
 ):
-    case = get(case_id=case_id, db_session=db_session)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
-    case_triage_status_flow(case=case, db_session=db_session)
-    case.escalated_at = datetime.utcnow()
+    now = datetime.utcnow()
+    case_triage_status_flow(case=case, db_session=db_session, now=now)
+    case.escalated_at = now
     case.status = CaseStatus.escalated
     db_session.commit()
 
@@ -804,7 +764,7 @@ def case_assign_role_flow(
 ):
     """Runs the case participant role assignment flow."""
     # we get the case
-    case = get(case_id=case_id, db_session=db_session)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
     # we add the participant to the incident if they're not a member already
     case_add_or_reactivate_participant_flow(participant_email, case.id, db_session=db_session)
@@ -829,7 +789,7 @@ def case_create_resources_flow(
     create_all_resources: bool = True,
 ) -> None:
     """Runs the case resource creation flow."""
-    case = get(db_session=db_session, case_id=case_id)
+    case = get_with_flow_relations(db_session=db_session, case_id=case_id)
 
     if case.assignee:
         individual_participants.append((case.assignee.individual, None))
@@ -837,19 +797,18 @@ def case_create_resources_flow(
     if case.reporter:
         individual_participants.append((case.reporter.individual, None))
 
+    direct_participant_emails = [i.email for i, _ in individual_participants]
+
     if create_all_resources:
         # we create the tactical group
-        direct_participant_emails = [i.email for i, _ in individual_participants]
-
-        indirect_participant_emails = [t.email for t in team_participants]
-
         if not case.groups:
+            group_participants = set(direct_participant_emails)
+            group_participants.update(t.email for t in team_participants)
+
             group_flows.create_group(
                 subject=case,
                 group_type=GroupType.tactical,
-                group_participants=list(
-                    set(direct_participant_emails + indirect_participant_emails)
-                ),
+                group_participants=list(group_participants),
                 db_session=db_session,
             )
 
@@ -867,18 +826,23 @@ def case_create_resources_flow(
             )
 
         # we create the investigation document
+        update_case_document = True
         if not case.case_document:
+            document_template = case.case_type.case_template_document
             document_flows.create_document(
                 subject=case,
                 document_type=DocumentResourceTypes.case,
-                document_template=case.case_type.case_template_document,
+                document_template=document_template,
                 db_session=db_session,
             )
+            # blank documents don't have any template placeholders to fill in
+            update_case_document = document_template is not None
 
-        # we update the case document
-        document_flows.update_document(
-            document=case.case_document, project_id=case.project.id, db_session=db_session
-        )
+        if case.case_document and update_case_document:
+            # we update the case document
+            document_flows.update_document(
+                document=case.case_document, project_id=case.project.id, db_session=db_session
+            )
 
     try:
         # we create the conversation and add participants to the thread
@@ -891,25 +855,54 @@ def case_create_resources_flow(
             case_id=case.id,
         )
         # wait until all resources are created before adding suggested participants
-        individual_participants = [x.email for x, _ in individual_participants]
+        # we don't rely on the add or reactivate participant flow here because
+        # we want to resolve participants and update the tactical group in bulk
+        participants = participant_service.get_by_case_id_and_emails(
+            db_session=db_session, case_id=case.id, emails=direct_participant_emails
+        )
+        for email in dict.fromkeys(direct_participant_emails):
+            try:
+                participant = participants.get(email)
+                if participant:
+                    if participant.active_roles:
+                        continue
+
+                    if case.status != CaseStatus.closed:
+                        # we reactivate the participant
+                        participant_flows.reactivate_participant(email, case, db_session)
+                else:
+                    # we add the participant to the case
+                    participant_flows.add_participant(email, case, db_session)
+            except Exception as e:
+                # don't fail to add all participants if one fails
+                db_session.rollback()
+                event_service.log_case_event(
+                    db_session=db_session,
+                    source="Dispatch Core App",
+                    description=f"Unable to add participant with email {email}",
+                    case_id=case.id,
+                    type=EventType.participant_updated,
+                )
+                log.exception(e)
 
-        for email in individual_participants:
-            # we don't rely on on this flow to add folks to the conversation because in this case
-            # we want to do it in bulk
-            case_add_or_reactivate_participant_flow(
+        if case.tactical_group:
+            # we add the participants to the tactical group
+            group_flows.update_group(
+                subject=case,
+                group=case.tactical_group,
+                group_action=GroupAction.add_members,
+                group_members=direct_participant_emails,
                 db_session=db_session,
-                user_email=email,
-                case_id=case.id,
-                add_to_conversation=False,
             )
+
         # # we add the participant to the conversation
         conversation_flows.add_case_participants(
             case=case,
-            participant_emails=individual_participants,
+            participant_emails=direct_participant_emails,
             db_session=db_session,
         )
 
-        for user_email in set(individual_participants):
+        for user_email in set(direct_participant_emails):
             send_participant_announcement_message(
                 db_session=db_session,
                 participant_email=user_email,
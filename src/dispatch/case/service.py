@@ -3,13 +3,16 @@ import logging
 from datetime import datetime, timedelta
 
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List, Optional
 
 from dispatch.auth.models import DispatchUser
 from dispatch.case.priority import service as case_priority_service
 from dispatch.case.severity import service as case_severity_service
 from dispatch.case.type import service as case_type_service
+from dispatch.case.type.models import CaseType
+from dispatch.database.core import bakery
 from dispatch.event import service as event_service
 from dispatch.exceptions import NotFoundError
 from dispatch.incident import service as incident_service
@@ -26,6 +29,7 @@ from .models import (
     CaseCreate,
     CaseRead,
     CaseUpdate,
+    assoc_cases_incidents,
 )
 
 
@@ -34,7 +38,40 @@ log = logging.getLogger(__name__)
 
 def get(*, db_session, case_id: int) -> Optional[Case]:
     """Returns an case based on the given id."""
-    return db_session.query(Case).filter(Case.id == case_id).first()
+    query = bakery(lambda session: session.query(Case))
+    query += lambda q: q.filter(Case.id == bindparam("case_id"))
+    return query(db_session).params(case_id=case_id).first()
+
+
+def get_with_flow_relations(*, db_session, case_id: int) -> Optional[Case]:
+    """Returns a case with the relationships used by case flows eagerly loaded."""
+    return (
+        db_session.query(Case)
+        .options(
+            joinedload(Case.project),
+            joinedload(Case.case_type).joinedload(CaseType.incident_type),
+            joinedload(Case.case_priority),
+            joinedload(Case.assignee).joinedload(Participant.individual),
+            joinedload(Case.tactical_group),
+            joinedload(Case.conversation),
+            joinedload(Case.case_document),
+            joinedload(Case.ticket),
+            joinedload(Case.storage),
+            selectinload(Case.groups),
+            selectinload(Case.incidents),
+        )
+        .filter(Case.id == case_id)
+        .first()
+    )
+
+
+def has_incidents(*, db_session, case_id: int) -> bool:
+    """Returns whether the given case has been linked to any incidents."""
+    return db_session.query(
+        db_session.query(assoc_cases_incidents)
+        .filter(assoc_cases_incidents.c.case_id == case_id)
+        .exists()
+    ).scalar()
 
 
 def get_by_name(*, db_session, project_id: int, name: str) -> Optional[Case]:
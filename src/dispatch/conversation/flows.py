@@ -358,6 +358,9 @@ def add_case_participants(
     db_session: Session,
 ):
     """Adds one or more participants to the case conversation."""
+    if not participant_emails:
+        return
+
     if not case.conversation:
         log.warning(
             "Case participant(s) not added to conversation. No conversation available for this case."
@@ -7,6 +7,7 @@ from fastapi import Depends
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.ext import baked
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
 from sqlalchemy.orm import object_session, sessionmaker, Session
 from sqlalchemy.sql.expression import true
@@ -47,6 +48,9 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(bind=engine)
 
+# caches the construction and compilation of frequently executed (baked) queries
+bakery = baked.bakery()
+
 
 def resolve_table_name(name):
     """Resolves table names to their mapped names."""
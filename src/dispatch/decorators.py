@@ -89,6 +89,9 @@ def background_task(func):
 
     As background tasks run in their own threads, it does not attempt
     to propagate errors.
+
+    The wrapped function runs synchronously; schedule it with FastAPI's
+    `BackgroundTasks` to run it after the response is sent.
     """
 
     @wraps(func)
@@ -6,7 +6,6 @@ import json
 import pytz
 
 from dispatch.auth import service as auth_service
-from dispatch.case import service as case_service
 from dispatch.incident import service as incident_service
 from dispatch.individual import service as individual_service
 from dispatch.enums import EventType
@@ -168,11 +167,9 @@ def log_case_event(
         details=details,
         type=type,
     )
-    event = create(db_session=db_session, event_in=event_in)
-
-    case = case_service.get(db_session=db_session, case_id=case_id)
-    case.events.append(event)
-    db_session.add(case)
+    # we associate the event with the case by id to avoid loading the case and its timeline
+    event = Event(**event_in.dict(), case_id=case_id)
+    db_session.add(event)
 
     if dispatch_user_id:
         dispatch_user = auth_service.get(db_session=db_session, user_id=dispatch_user_id)
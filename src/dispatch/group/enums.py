@@ -8,4 +8,5 @@ class GroupType(DispatchEnum):
 
 class GroupAction(DispatchEnum):
     add_member = "add_member"
+    add_members = "add_members"
     remove_member = "remove_member"
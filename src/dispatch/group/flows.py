@@ -92,13 +92,14 @@ def update_group(
     subject: Subject,
     group: Group,
     group_action: GroupAction,
-    group_member: str,
     db_session: SessionLocal,
+    group_member: str = None,
+    group_members: List[str] = None,
 ):
     """Updates an existing group."""
     if group is None:
         log.warning(
-            f"Group not updated. No group provided. Cannot {group_action} for {group_member}."
+            f"Group not updated. No group provided. Cannot {group_action} for {group_member or group_members}."
         )
         return
 
@@ -111,38 +112,46 @@ def update_group(
 
     # we get the list of group members
     try:
-        group_members = plugin.instance.list(email=group.email)
+        current_group_members = plugin.instance.list(email=group.email)
     except Exception as e:
         log.exception(e)
         return
 
     subject_type = get_table_name_by_class_instance(subject)
 
-    # we add the member to the group if it's not a member
-    if group_action == GroupAction.add_member and group_member not in group_members:
-        try:
-            plugin.instance.add(email=group.email, participants=[group_member])
-        except Exception as e:
-            log.exception(e)
-            return
-
-        if subject_type == "case":
-            event_service.log_case_event(
-                db_session=db_session,
-                source=plugin.plugin.title,
-                description=f"{group_member} added to case group ({group.email})",
-                case_id=subject.id,
-            )
-        if subject_type == "incident":
-            event_service.log_incident_event(
-                db_session=db_session,
-                source=plugin.plugin.title,
-                description=f"{group_member} added to incident group ({group.email})",
-                incident_id=subject.id,
-            )
+    # we add the member(s) to the group if they're not members, preserving input order
+    if group_action in (GroupAction.add_member, GroupAction.add_members):
+        members = [group_member] if group_action == GroupAction.add_member else group_members
+        new_group_members = []
+        for member in members or []:
+            if member not in current_group_members and member not in new_group_members:
+                new_group_members.append(member)
+
+        if new_group_members:
+            try:
+                plugin.instance.add(email=group.email, participants=new_group_members)
+            except Exception as e:
+                log.exception(e)
+                return
+
+            new_group_members_str = ", ".join(new_group_members)
+            if subject_type == "case":
+                event_service.log_case_event(
+                    db_session=db_session,
+                    source=plugin.plugin.title,
+                    description=f"{new_group_members_str} added to case group ({group.email})",
+                    case_id=subject.id,
+                )
+            if subject_type == "incident":
+                event_service.log_incident_event(
+                    db_session=db_session,
+                    source=plugin.plugin.title,
+                    description=f"{new_group_members_str} added to incident group ({group.email})",
+                    incident_id=subject.id,
+                )
 
     # we remove the member from the group if it's a member
-    if group_action == GroupAction.remove_member and group_member in group_members:
+    if group_action == GroupAction.remove_member and group_member in current_group_members:
         try:
             plugin.instance.remove(email=group.email, participants=[group_member])
         except Exception as e:
@@ -1,5 +1,8 @@
-from typing import List, Optional
-from dispatch.database.core import SessionLocal
+from typing import Dict, List, Optional
+from sqlalchemy import bindparam, or_
+from sqlalchemy.orm import contains_eager
+
+from dispatch.database.core import SessionLocal, bakery
 from dispatch.decorators import timer
 from dispatch.case import service as case_service
 from dispatch.incident import service as incident_service
@@ -68,12 +71,46 @@ def get_by_incident_id_and_email(
 
 def get_by_case_id_and_email(*, db_session, case_id: int, email: str) -> Optional[Participant]:
     """Get a participant by case id and email."""
-    return (
+    query = bakery(lambda session: session.query(Participant))
+    query += lambda q: q.join(IndividualContact)
+    query += lambda q: q.filter(Participant.case_id == bindparam("case_id"))
+    query += lambda q: q.filter(IndividualContact.email == bindparam("email"))
+    return query(db_session).params(case_id=case_id, email=email).one_or_none()
+
+
+def get_by_case_id_and_emails(
+    *, db_session, case_id: int, emails: List[str]
+) -> Dict[str, Participant]:
+    """Get the participants of a case for the given emails, keyed by email."""
+    if not emails:
+        return {}
+
+    participants = (
         db_session.query(Participant)
         .join(IndividualContact)
+        .options(contains_eager(Participant.individual))
         .filter(Participant.case_id == case_id)
-        .filter(IndividualContact.email == email)
-        .one_or_none()
+        .filter(IndividualContact.email.in_(set(emails)))
+        .all()
+    )
+    return {participant.individual.email: participant for participant in participants}
+
+
+def get_by_case_id_email_or_service_id(
+    *, db_session, case_id: int, email: str, service_id: int = None
+) -> List[Participant]:
+    """Get the participants of a case matching the given email or service id."""
+    criteria = IndividualContact.email == email
+    if service_id:
+        criteria = or_(criteria, Participant.service_id == service_id)
+
+    return (
+        db_session.query(Participant)
+        .outerjoin(IndividualContact)
+        .options(contains_eager(Participant.individual))
+        .filter(Participant.case_id == case_id)
+        .filter(criteria)
+        .all()
     )
 
 
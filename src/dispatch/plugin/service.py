@@ -1,7 +1,9 @@
 import logging
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from sqlalchemy import bindparam
 from typing import List, Optional
 
+from dispatch.database.core import bakery
 from dispatch.exceptions import InvalidConfigurationError
 from dispatch.plugins.bases import OncallPlugin
 from dispatch.project import service as project_service
@@ -19,6 +21,8 @@ from .models import (
 
 log = logging.getLogger(__name__)
 
+ACTIVE_INSTANCE_CACHE_KEY = "active_plugin_instances"
+
 
 def get(*, db_session, plugin_id: int) -> Optional[Plugin]:
     """Returns a plugin based on the given plugin id."""
@@ -49,19 +53,48 @@ def get_instance(*, db_session, plugin_instance_id: int) -> Optional[PluginInsta
     )
 
 
+def _clear_active_instance_cache(db_session) -> None:
+    """Clears the active plugin instances cached on the given session."""
+    db_session.info.pop(ACTIVE_INSTANCE_CACHE_KEY, None)
+
+
 def get_active_instance(
     *, db_session, plugin_type: str, project_id=None
 ) -> Optional[PluginInstance]:
-    """Fetches the current active plugin for the given type."""
-    return (
-        db_session.query(PluginInstance)
-        .join(Plugin)
-        .filter(Plugin.type == plugin_type)
-        .filter(PluginInstance.project_id == project_id)
-        .filter(PluginInstance.enabled == True)  # noqa
-        .one_or_none()
+    """Fetches the current active plugin for the given type.
+
+    The id of the active instance is cached on the session, so repeated lookups
+    go through the identity map instead of joining against the plugin table.
+    """
+    cache = db_session.info.setdefault(ACTIVE_INSTANCE_CACHE_KEY, {})
+    key = (project_id, plugin_type)
+
+    plugin_instance_id = cache.get(key)
+    if plugin_instance_id is not None:
+        # served from the identity map, or reloaded by primary key once expired (e.g. by a commit)
+        plugin_instance = db_session.query(PluginInstance).get(plugin_instance_id)
+        if plugin_instance and plugin_instance.enabled:
+            return plugin_instance
+
+    query = bakery(lambda session: session.query(PluginInstance))
+    query += lambda q: q.join(Plugin)
+    query += lambda q: q.filter(Plugin.type == bindparam("plugin_type"))
+    if project_id is None:
+        query += lambda q: q.filter(PluginInstance.project_id.is_(None))
+    else:
+        query += lambda q: q.filter(PluginInstance.project_id == bindparam("project_id"))
+    query += lambda q: q.filter(PluginInstance.enabled == True)  # noqa
+    plugin_instance = (
+        query(db_session).params(plugin_type=plugin_type, project_id=project_id).one_or_none()
     )
 
+    if plugin_instance:
+        cache[key] = plugin_instance.id
+    else:
+        cache.pop(key, None)
+
+    return plugin_instance
+
 
 def get_active_instances(
     *, db_session, plugin_type: str, project_id=None
@@ -120,6 +153,7 @@ def create_instance(*, db_session, plugin_instance_in: PluginInstanceCreate) ->
 
     db_session.add(plugin_instance)
     db_session.commit()
+    _clear_active_instance_cache(db_session)
     return plugin_instance
 
 
@@ -166,6 +200,7 @@ def update_instance(
     plugin_instance.configuration = plugin_instance_in.configuration
 
     db_session.commit()
+    _clear_active_instance_cache(db_session)
     return plugin_instance
 
 
@@ -173,6 +208,7 @@ def delete_instance(*, db_session, plugin_instance_id: int):
     """Deletes a plugin instance."""
     db_session.query(PluginInstance).filter(PluginInstance.id == plugin_instance_id).delete()
     db_session.commit()
+    _clear_active_instance_cache(db_session)
 
 
 def get_plugin_event_by_id(*, db_session, plugin_event_id: int) -> Optional[PluginEvent]:
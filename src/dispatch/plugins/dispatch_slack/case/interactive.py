@@ -1285,6 +1285,7 @@ def handle_escalation_submission_event(
         incident_priority=incident_priority,
         incident_type=incident_type,
     )
+    db_session.commit()
     incident = case.incidents[0]
 
     # Retrieve all participants from the case
@@ -12,6 +12,46 @@ def test_get(session, case: Case):
     assert t_case.id == case.id
 
 
+def test_get_with_flow_relations(session, case: Case):
+    from sqlalchemy import inspect
+
+    from dispatch.case.service import get_with_flow_relations
+
+    case_id = case.id
+
+    # we make sure the case is loaded from the database rather than the identity map
+    session.expunge_all()
+
+    t_case = get_with_flow_relations(db_session=session, case_id=case_id)
+    assert t_case.id == case_id
+
+    unloaded = inspect(t_case).unloaded
+    for relationship in (
+        "project",
+        "case_type",
+        "case_priority",
+        "assignee",
+        "tactical_group",
+        "conversation",
+        "case_document",
+        "ticket",
+        "storage",
+        "groups",
+        "incidents",
+    ):
+        assert relationship not in unloaded
+
+
+def test_has_incidents(session, case: Case, incident):
+    from dispatch.case.service import has_incidents
+
+    assert not has_incidents(db_session=session, case_id=case.id)
+
+    case.incidents.append(incident)
+    session.commit()
+    assert has_incidents(db_session=session, case_id=case.id)
+
+
 def test_get_by_name(session, case: Case):
     from dispatch.case.service import get_by_name
 
@@ -0,0 +1,34 @@
+def test_update_group_add_members(
+    session, case, group, plugin_instance, participant_group_plugin, monkeypatch
+):
+    from dispatch.group.enums import GroupAction
+    from dispatch.group.flows import update_group
+
+    plugin_instance.plugin.type = participant_group_plugin.type
+    plugin_instance.plugin.slug = participant_group_plugin.slug
+    plugin_instance.project = case.project
+    session.commit()
+
+    added = []
+    monkeypatch.setattr(
+        participant_group_plugin, "list", lambda self, email: ["a@example.com"], raising=False
+    )
+    monkeypatch.setattr(
+        participant_group_plugin,
+        "add",
+        lambda self, email, participants: added.append(participants),
+    )
+
+    update_group(
+        subject=case,
+        group=group,
+        group_action=GroupAction.add_members,
+        group_members=["c@example.com", "a@example.com", "b@example.com", "c@example.com"],
+        db_session=session,
+    )
+
+    # existing members and duplicates are skipped, and input order is preserved
+    assert added == [["c@example.com", "b@example.com"]]
+    assert [event.description for event in case.events] == [
+        f"c@example.com, b@example.com added to case group ({group.email})"
+    ]
@@ -30,3 +30,48 @@ def test_delete(session, participant):
 
     delete(db_session=session, participant_id=participant.id)
     assert not get(db_session=session, participant_id=participant.id)
+
+
+def test_get_by_case_id_and_emails(session, case, participant):
+    from dispatch.participant.service import get_by_case_id_and_emails
+
+    participant.case_id = case.id
+    session.commit()
+
+    email = participant.individual.email
+    t_participants = get_by_case_id_and_emails(
+        db_session=session, case_id=case.id, emails=[email, "unknown@example.com"]
+    )
+    assert list(t_participants) == [email]
+    assert t_participants[email].id == participant.id
+
+
+def test_get_by_case_id_email_or_service_id(session, case, participant):
+    from dispatch.participant.service import get_by_case_id_email_or_service_id
+
+    participant.case_id = case.id
+    session.commit()
+
+    t_participants = get_by_case_id_email_or_service_id(
+        db_session=session, case_id=case.id, email=participant.individual.email
+    )
+    assert [p.id for p in t_participants] == [participant.id]
+
+    t_participants = get_by_case_id_email_or_service_id(
+        db_session=session, case_id=case.id, email="unknown@example.com"
+    )
+    assert not t_participants
+
+
+def test_get_by_case_id_email_or_service_id_service(session, case, participant, service):
+    from dispatch.participant.service import get_by_case_id_email_or_service_id
+
+    participant.case_id = case.id
+    participant.service_id = service.id
+    session.commit()
+
+    # the participant is only matched by its service id
+    t_participants = get_by_case_id_email_or_service_id(
+        db_session=session, case_id=case.id, email="unknown@example.com", service_id=service.id
+    )
+    assert [p.id for p in t_participants] == [participant.id]
@@ -15,6 +15,101 @@ def test_get_instance(session, plugin_instance):
     assert t_plugin_instance.id == plugin_instance.id
 
 
+def _count_statements(session):
+    """Records the statements executed on the session's connection."""
+    from sqlalchemy import event
+
+    statements = []
+    event.listen(
+        session.connection(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def _get_active_instance(session, project_id, plugin_type):
+    from dispatch.plugin.service import get_active_instance
+
+    return get_active_instance(db_session=session, project_id=project_id, plugin_type=plugin_type)
+
+
+def test_get_active_instance(session, plugin_instance):
+    from dispatch.plugin.service import ACTIVE_INSTANCE_CACHE_KEY
+
+    key = (plugin_instance.project_id, plugin_instance.plugin.type)
+
+    t_plugin_instance = _get_active_instance(session, *key)
+    assert t_plugin_instance.id == plugin_instance.id
+    assert session.info[ACTIVE_INSTANCE_CACHE_KEY][key] == t_plugin_instance.id
+
+    # subsequent lookups are served from the session cache without querying
+    statements = _count_statements(session)
+    assert _get_active_instance(session, *key) is t_plugin_instance
+    assert not statements
+
+
+def test_get_active_instance_expired(session, plugin_instance):
+    key = (plugin_instance.project_id, plugin_instance.plugin.type)
+    t_plugin_instance = _get_active_instance(session, *key)
+
+    # expired instances (e.g. after a commit) are reloaded by primary key
+    session.expire(t_plugin_instance)
+    statements = _count_statements(session)
+    assert _get_active_instance(session, *key) is t_plugin_instance
+    assert len(statements) == 1
+    assert "JOIN" not in statements[0]
+
+
+def test_get_active_instance_disabled(session, plugin_instance):
+    key = (plugin_instance.project_id, plugin_instance.plugin.type)
+    t_plugin_instance = _get_active_instance(session, *key)
+
+    # disabled instances are not served from the cache
+    t_plugin_instance.enabled = False
+    assert not _get_active_instance(session, *key)
+
+
+def test_create_instance_clears_active_instance_cache(session, plugin, project):
+    from dispatch.plugin.service import ACTIVE_INSTANCE_CACHE_KEY, create_instance
+    from dispatch.plugin.models import PluginInstanceCreate
+
+    session.info[ACTIVE_INSTANCE_CACHE_KEY] = {(project.id, plugin.type): None}
+
+    plugin_instance_in = PluginInstanceCreate.construct(
+        enabled=True, configuration={}, plugin=plugin, project=project
+    )
+    create_instance(db_session=session, plugin_instance_in=plugin_instance_in)
+    assert ACTIVE_INSTANCE_CACHE_KEY not in session.info
+
+
+def test_update_instance_clears_active_instance_cache(session, plugin_instance):
+    from dispatch.plugin.service import ACTIVE_INSTANCE_CACHE_KEY, update_instance
+    from dispatch.plugin.models import PluginInstanceUpdate
+
+    _get_active_instance(session, plugin_instance.project_id, plugin_instance.plugin.type)
+    assert session.info[ACTIVE_INSTANCE_CACHE_KEY]
+
+    update_instance(
+        db_session=session,
+        plugin_instance=plugin_instance,
+        plugin_instance_in=PluginInstanceUpdate(enabled=True),
+    )
+    assert ACTIVE_INSTANCE_CACHE_KEY not in session.info
+
+
+def test_delete_instance_clears_active_instance_cache(session, plugin_instance):
+    from dispatch.plugin.service import ACTIVE_INSTANCE_CACHE_KEY, delete_instance
+
+    key = (plugin_instance.project_id, plugin_instance.plugin.type)
+    _get_active_instance(session, *key)
+    assert session.info[ACTIVE_INSTANCE_CACHE_KEY]
+
+    delete_instance(db_session=session, plugin_instance_id=plugin_instance.id)
+    assert ACTIVE_INSTANCE_CACHE_KEY not in session.info
+    assert not _get_active_instance(session, *key)
+
+
 @pytest.mark.skip
 def test_create_instance(session, plugin, project):
     from dispatch.plugin.service import create_instance